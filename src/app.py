@@ -1,12 +1,13 @@
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk, scrolledtext
 from PIL import Image, ImageTk
-from typing import Optional
+from typing import Optional, List, Dict
 import logging
 
 from config import Config
 from model_manager import ModelManager
 from image_processor import ImageProcessor
+from image_exporter import ImageExporter, ExportOptions
 from detection_analyzer import DetectionAnalyzer
 
 logger = logging.getLogger(__name__)
@@ -21,9 +22,19 @@ class YOLODetectorApp:
         self.model_manager = ModelManager()
         self.image_processor = ImageProcessor()
         self.analyzer = DetectionAnalyzer()
+        self.exporter = ImageExporter(
+            max_workers=self.config.EXPORT_WORKERS,
+            options=ExportOptions(
+                jpeg_quality=self.config.EXPORT_JPEG_QUALITY,
+                jpeg_progressive=self.config.EXPORT_JPEG_PROGRESSIVE,
+                png_compression=self.config.EXPORT_PNG_COMPRESSION,
+                webp_quality=self.config.EXPORT_WEBP_QUALITY
+            )
+        )
         
         self.current_image_path: Optional[str] = None
         self.result_image: Optional[any] = None
+        self.result_detections: List[Dict] = []
         
         self._setup_window()
         self._setup_ui()
@@ -34,6 +45,7 @@ class YOLODetectorApp:
         self.root.title(self.config.WINDOW_TITLE)
         self.root.geometry(self.config.WINDOW_SIZE)
         self.root.configure(bg=self.config.COLOR_BG)
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
     
     def _setup_ui(self):
         """Create user interface"""
@@ -85,6 +97,7 @@ class YOLODetectorApp:
         
         # Settings row
         self._create_confidence_slider(control_frame)
+        self._create_export_settings(control_frame)
     
     def _create_button(self, parent, text: str, command, bg_color: str, 
                       state=tk.NORMAL) -> tk.Button:
@@ -123,6 +136,23 @@ class YOLODetectorApp:
         
         self.confidence_var.trace('w', self._update_confidence_label)
     
+    def _create_export_settings(self, parent):
+        """Create detections sidecar selector"""
+        export_row = tk.Frame(parent, bg=self.config.COLOR_BG)
+        export_row.pack(pady=5)
+        
+        tk.Label(
+            export_row, text="🗂️ ملف الكشوفات:", font=("Arial", 10, "bold"),
+            bg=self.config.COLOR_BG
+        ).pack(side=tk.LEFT, padx=5)
+        
+        self.sidecar_var = tk.StringVar(value="بدون")
+        
+        ttk.Combobox(
+            export_row, textvariable=self.sidecar_var, state="readonly",
+            values=["بدون"] + self.config.EXPORT_SIDECAR_FORMATS, width=8
+        ).pack(side=tk.LEFT, padx=5)
+    
     def _create_progress_bar(self):
         """Create progress bar"""
         self.progress = ttk.Progressbar(
@@ -314,10 +344,11 @@ class YOLODetectorApp:
         self.panel.image = img_tk
         
         # Analyze and display statistics
-        stats = self.analyzer.analyze_results(
+        self.result_detections = self.analyzer.extract_detections(
             result, 
             self.model_manager.get_class_names()
         )
+        stats = self.analyzer.summarize_detections(self.result_detections)
         info_text = self.analyzer.format_statistics(stats)
         self._update_info_panel(info_text)
         
@@ -342,16 +373,63 @@ class YOLODetectorApp:
         if not save_path:
             return
         
-        result_bgr = self.image_processor.rgb_to_bgr(self.result_image)
+        sidecar = self.sidecar_var.get()
+        options = self.exporter.options.with_sidecar(
+            sidecar if sidecar in self.config.EXPORT_SIDECAR_FORMATS else None
+        )
         
-        if self.image_processor.save_image(result_bgr, save_path):
-            messagebox.showinfo(
-                "نجح", 
-                f"تم حفظ الصورة في:\n{save_path}"
+        # Color conversion and encoding run on the export pool
+        future = self.exporter.submit(
+            self.result_image, save_path, self.result_detections,
+            from_rgb=True, options=options
+        )
+        
+        self.save_btn.config(state=tk.DISABLED)
+        self._show_progress()
+        self._update_status("جاري حفظ النتيجة...")
+        self._poll_export(future)
+    
+    def _poll_export(self, future):
+        """Wait for a pending export without blocking the Tk event loop"""
+        if not future.done():
+            self.root.after(
+                self.config.EXPORT_POLL_INTERVAL_MS, 
+                self._poll_export, future
+            )
+            return
+        
+        self._hide_progress()
+        if self.result_image is not None:
+            self.save_btn.config(state=tk.NORMAL)
+        
+        result = future.result()
+        if result["image_written"]:
+            mb_per_sec = (
+                result["bytes"] / (1024 * 1024) / result["seconds"]
+                if result["seconds"] else 0.0
+            )
+            if result["sidecar_error"]:
+                messagebox.showwarning(
+                    "تحذير", 
+                    f"تم حفظ الصورة في:\n{result['path']}\n\n"
+                    f"لكن فشل حفظ ملف الكشوفات:\n{result['sidecar_error']}"
+                )
+            else:
+                messagebox.showinfo(
+                    "نجح", 
+                    f"تم حفظ الصورة في:\n{result['path']}"
+                )
+            self._update_status(
+                f"✓ تم حفظ النتيجة ({result['bytes'] / 1024:.0f} KB "
+                f"في {result['seconds']:.2f} ث - "
+                f"{mb_per_sec:.1f} MB/s)"
             )
-            self._update_status("✓ تم حفظ النتيجة")
         else:
-            messagebox.showerror("خطأ", "فشل حفظ الصورة")
+            messagebox.showerror(
+                "خطأ", 
+                f"فشل حفظ الصورة:\n{result['error']}"
+            )
+            self._update_status("✗ فشل حفظ النتيجة")
     
     def reset(self):
         """Reset application state"""
@@ -362,6 +440,22 @@ class YOLODetectorApp:
         self.panel.image = None
         self.current_image_path = None
         self.result_image = None
+        self.result_detections = []
         self.save_btn.config(state=tk.DISABLED)
         self._update_status("✓ تم إعادة التعيين - جاهز للاستخدام")
-        self._display_available_classes()
\ No newline at end of file
+        self._display_available_classes()
+    
+    def _on_close(self):
+        """Finish pending exports before closing"""
+        if self.exporter.pending_count() == 0:
+            self.exporter.shutdown(wait=False)
+            self.root.destroy()
+            return
+        
+        for button in (self.select_btn, self.save_btn, self.reset_btn):
+            button.config(state=tk.DISABLED)
+        self.root.protocol("WM_DELETE_WINDOW", lambda: None)
+        self._update_status(
+            f"جاري إنهاء {self.exporter.pending_count()} عملية حفظ قبل الإغلاق..."
+        )
+        self.root.after(self.config.EXPORT_POLL_INTERVAL_MS, self._on_close)
\ No newline at end of file
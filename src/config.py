@@ -30,5 +30,15 @@ class Config:
     SAVE_FILETYPES = [
         ("JPEG", "*.jpg"),
         ("PNG", "*.png"),
+        ("WebP", "*.webp"),
         ("جميع الملفات", "*.*")
-    ]
\ No newline at end of file
+    ]
+    
+    # Export settings
+    EXPORT_WORKERS = 4
+    EXPORT_JPEG_QUALITY = 95
+    EXPORT_JPEG_PROGRESSIVE = False
+    EXPORT_PNG_COMPRESSION = 3
+    EXPORT_WEBP_QUALITY = 90
+    EXPORT_SIDECAR_FORMATS = ["json", "csv"]
+    EXPORT_POLL_INTERVAL_MS = 100
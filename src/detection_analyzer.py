@@ -1,4 +1,4 @@
-from typing import Dict
+from typing import Dict, List
 
 
 class DetectionAnalyzer:
@@ -19,28 +19,63 @@ class DetectionAnalyzer:
             - objects: Dict of object types and their confidences
             - unique_types: Number of unique object types
         """
-        boxes = result.boxes
-        
-        if len(boxes) == 0:
-            return {"count": 0, "objects": {}, "unique_types": 0}
+        detections = DetectionAnalyzer.extract_detections(result, model_names)
+        return DetectionAnalyzer.summarize_detections(detections)
+    
+    @staticmethod
+    def summarize_detections(detections: List[Dict]) -> Dict:
+        """
+        Build detection statistics from per-box records
         
+        Args:
+            detections: Records from extract_detections
+            
+        Returns:
+            Dictionary in the same format as analyze_results
+        """
         objects_dict = {}
         
-        for box in boxes:
-            cls_id = int(box.cls[0])
-            conf = float(box.conf[0])
-            class_name = model_names[cls_id]
-            
-            if class_name not in objects_dict:
-                objects_dict[class_name] = []
-            objects_dict[class_name].append(conf)
+        for detection in detections:
+            objects_dict.setdefault(detection["class_name"], []).append(
+                detection["confidence"]
+            )
         
         return {
-            "count": len(boxes),
+            "count": len(detections),
             "objects": objects_dict,
             "unique_types": len(objects_dict)
         }
     
+    @staticmethod
+    def extract_detections(result, model_names: Dict[int, str]) -> List[Dict]:
+        """
+        Extract per-box detection records from results
+        
+        Args:
+            result: YOLO detection result
+            model_names: Dictionary of class names
+            
+        Returns:
+            List of dictionaries, one per detection, with keys:
+            class_id, class_name, confidence, x1, y1, x2, y2
+        """
+        detections = []
+        
+        for box in result.boxes:
+            cls_id = int(box.cls[0])
+            x1, y1, x2, y2 = (float(v) for v in box.xyxy[0])
+            detections.append({
+                "class_id": cls_id,
+                "class_name": model_names[cls_id],
+                "confidence": float(box.conf[0]),
+                "x1": x1,
+                "y1": y1,
+                "x2": x2,
+                "y2": y2
+            })
+        
+        return detections
+    
     @staticmethod
     def format_statistics(stats: Dict) -> str:
         """
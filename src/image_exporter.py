@@ -0,0 +1,282 @@
+"""Asynchronous image export"""
+
+import csv
+import json
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional, List, Dict
+import logging
+
+import cv2
+
+from image_processor import ImageProcessor
+
+logger = logging.getLogger(__name__)
+
+
+class ExportOptions:
+    """Encoding and sidecar settings for exported images"""
+    
+    SIDECAR_FORMATS = (None, "json", "csv")
+    
+    def __init__(self, jpeg_quality: int = 95, jpeg_progressive: bool = False,
+                 png_compression: int = 3, webp_quality: int = 90,
+                 sidecar_format: Optional[str] = None):
+        """
+        Raises:
+            ValueError: If a quality, compression level or sidecar
+                format is out of range
+        """
+        self._check_range("jpeg_quality", jpeg_quality, 0, 100)
+        self._check_range("png_compression", png_compression, 0, 9)
+        self._check_range("webp_quality", webp_quality, 1, 100)
+        if sidecar_format not in self.SIDECAR_FORMATS:
+            raise ValueError(f"Unsupported sidecar format: {sidecar_format}")
+        
+        self.jpeg_quality = jpeg_quality
+        self.jpeg_progressive = jpeg_progressive
+        self.png_compression = png_compression
+        self.webp_quality = webp_quality
+        self.sidecar_format = sidecar_format
+    
+    @staticmethod
+    def _check_range(name: str, value: int, low: int, high: int):
+        """Raise ValueError if value is outside [low, high]"""
+        if not low <= value <= high:
+            raise ValueError(f"{name} must be between {low} and {high}: {value}")
+    
+    def with_sidecar(self, sidecar_format: Optional[str]) -> "ExportOptions":
+        """Return a copy of these options with a different sidecar format"""
+        return ExportOptions(
+            jpeg_quality=self.jpeg_quality,
+            jpeg_progressive=self.jpeg_progressive,
+            png_compression=self.png_compression,
+            webp_quality=self.webp_quality,
+            sidecar_format=sidecar_format
+        )
+    
+    def encode_params(self, path: str) -> List[int]:
+        """
+        Build OpenCV encoding flags for the file type of path
+        
+        Args:
+            path: Destination path (extension selects the encoder)
+        
+        Returns:
+            Flat list of OpenCV IMWRITE_* flag/value pairs
+        """
+        ext = os.path.splitext(path)[1].lower()
+        
+        if ext in (".jpg", ".jpeg"):
+            return [
+                cv2.IMWRITE_JPEG_QUALITY, int(self.jpeg_quality),
+                cv2.IMWRITE_JPEG_PROGRESSIVE, int(self.jpeg_progressive)
+            ]
+        if ext == ".png":
+            return [cv2.IMWRITE_PNG_COMPRESSION, int(self.png_compression)]
+        if ext == ".webp":
+            return [cv2.IMWRITE_WEBP_QUALITY, int(self.webp_quality)]
+        return []
+
+
+class ImageExporter:
+    """Encodes and writes images on a background thread pool"""
+    
+    SIDECAR_FIELDS = [
+        "class_id", "class_name", "confidence", "x1", "y1", "x2", "y2"
+    ]
+    
+    def __init__(self, max_workers: int = 4,
+                 options: Optional[ExportOptions] = None):
+        self.options = options or ExportOptions()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="export"
+        )
+        self._lock = threading.Lock()
+        self._pending = set()
+        self._images = 0
+        self._failures = 0
+        self._bytes = 0
+        self._encode_seconds = 0.0
+    
+    def submit(self, image, path: str, detections: Optional[List[Dict]] = None,
+               from_rgb: bool = False,
+               options: Optional[ExportOptions] = None) -> Future:
+        """
+        Queue an image for export
+        
+        Args:
+            image: Image to save (BGR unless from_rgb is set)
+            path: Destination path
+            detections: Optional records from DetectionAnalyzer.extract_detections
+            from_rgb: Convert image from RGB to BGR before encoding
+            options: Per-call override of the exporter's options
+        
+        Returns:
+            Future resolving to an export result dictionary:
+            - path: Destination path
+            - success: Whether image and sidecar were both written
+            - image_written: Whether the image itself was written
+            - error: Image error message or None
+            - sidecar_error: Sidecar error message or None
+            - bytes: Size of the written image
+            - seconds: Time spent converting and encoding
+        """
+        future = self._executor.submit(
+            self._export, image, path, detections, from_rgb,
+            options or self.options
+        )
+        with self._lock:
+            self._pending.add(future)
+        future.add_done_callback(self._discard_pending)
+        return future
+    
+    def export_batch(self, items: List[Dict],
+                     options: Optional[ExportOptions] = None) -> Dict:
+        """
+        Export several images in parallel and wait for all of them
+        
+        Args:
+            items: Dictionaries with keys image, path and optionally
+                detections and from_rgb
+            options: Per-batch override of the exporter's options
+        
+        Returns:
+            Dictionary containing:
+            - results: Export result dictionaries, in the order of items
+            - images: Number of images written
+            - bytes: Total size of the written images
+            - seconds: Wall-clock time from first submit to last result
+            - images_per_sec: Images written per wall-clock second
+            - mb_per_sec: Megabytes written per wall-clock second
+        """
+        start = time.perf_counter()
+        futures = [
+            self.submit(
+                item["image"], item["path"], item.get("detections"),
+                item.get("from_rgb", False), options
+            )
+            for item in items
+        ]
+        results = [future.result() for future in futures]
+        seconds = time.perf_counter() - start
+        
+        written = [r for r in results if r["image_written"]]
+        total_bytes = sum(r["bytes"] for r in written)
+        return {
+            "results": results,
+            "images": len(written),
+            "bytes": total_bytes,
+            "seconds": seconds,
+            "images_per_sec": len(written) / seconds if seconds else 0.0,
+            "mb_per_sec": (
+                total_bytes / (1024 * 1024) / seconds if seconds else 0.0
+            )
+        }
+    
+    def get_statistics(self) -> Dict:
+        """
+        Get cumulative per-worker encode statistics
+        
+        Times are summed over workers, so the rates describe how fast a
+        single worker encodes, not the pool's overall throughput (see
+        export_batch for wall-clock throughput).
+        
+        Returns:
+            Dictionary with images, failures, bytes, encode_seconds,
+            encode_images_per_sec and encode_mb_per_sec
+        """
+        with self._lock:
+            seconds = self._encode_seconds
+            return {
+                "images": self._images,
+                "failures": self._failures,
+                "bytes": self._bytes,
+                "encode_seconds": seconds,
+                "encode_images_per_sec": (
+                    self._images / seconds if seconds else 0.0
+                ),
+                "encode_mb_per_sec": (
+                    self._bytes / (1024 * 1024) / seconds if seconds else 0.0
+                )
+            }
+    
+    def pending_count(self) -> int:
+        """Number of submitted exports that have not finished yet"""
+        with self._lock:
+            return len(self._pending)
+    
+    def shutdown(self, wait: bool = True):
+        """Stop accepting work, optionally waiting for pending exports"""
+        self._executor.shutdown(wait=wait)
+    
+    def _discard_pending(self, future: Future):
+        """Forget a finished future"""
+        with self._lock:
+            self._pending.discard(future)
+    
+    def _export(self, image, path: str, detections: Optional[List[Dict]],
+                from_rgb: bool, options: ExportOptions) -> Dict:
+        """Convert, encode and write a single image (runs on a worker)"""
+        result = {
+            "path": path, "success": False, "image_written": False,
+            "error": None, "sidecar_error": None, "bytes": 0, "seconds": 0.0
+        }
+        
+        start = time.perf_counter()
+        try:
+            if from_rgb:
+                image = ImageProcessor.rgb_to_bgr(image)
+            ImageProcessor.write_image(image, path, options.encode_params(path))
+            result["image_written"] = True
+            result["bytes"] = os.path.getsize(path)
+        except Exception as e:
+            logger.error(f"Export error for {path}: {str(e)}")
+            result["error"] = str(e)
+        result["seconds"] = time.perf_counter() - start
+        
+        if (result["image_written"] and options.sidecar_format
+                and detections is not None):
+            try:
+                self._write_sidecar(path, detections, options.sidecar_format)
+            except Exception as e:
+                logger.error(f"Sidecar error for {path}: {str(e)}")
+                result["sidecar_error"] = str(e)
+        
+        result["success"] = (
+            result["image_written"] and result["sidecar_error"] is None
+        )
+        self._record(result)
+        return result
+    
+    def _write_sidecar(self, image_path: str, detections: List[Dict],
+                       sidecar_format: str):
+        """Write detections next to the image as JSON or CSV"""
+        sidecar_path = f"{os.path.splitext(image_path)[0]}.{sidecar_format}"
+        
+        if sidecar_format == "json":
+            with open(sidecar_path, "w", encoding="utf-8") as f:
+                json.dump(
+                    {"image": os.path.basename(image_path),
+                     "detections": detections},
+                    f, ensure_ascii=False, indent=2
+                )
+        elif sidecar_format == "csv":
+            with open(sidecar_path, "w", encoding="utf-8", newline="") as f:
+                writer = csv.DictWriter(f, fieldnames=self.SIDECAR_FIELDS)
+                writer.writeheader()
+                writer.writerows(detections)
+        else:
+            raise ValueError(f"Unsupported sidecar format: {sidecar_format}")
+    
+    def _record(self, result: Dict):
+        """Accumulate per-worker encode statistics"""
+        with self._lock:
+            if result["image_written"]:
+                self._images += 1
+                self._bytes += result["bytes"]
+                self._encode_seconds += result["seconds"]
+            if not result["success"]:
+                self._failures += 1
@@ -1,6 +1,6 @@
 import cv2
 import logging
-from typing import Optional
+from typing import Optional, List
 
 logger = logging.getLogger(__name__)
 
@@ -62,19 +62,37 @@ class ImageProcessor:
         return cv2.cvtColor(image, cv2.COLOR_RGB2BGR)
     
     @staticmethod
-    def save_image(image, path: str) -> bool:
+    def write_image(image, path: str, params: Optional[List[int]] = None):
+        """
+        Write image to file, raising on failure
+        
+        Args:
+            image: Image to save
+            path: Destination path
+            params: Optional OpenCV encoding flags (e.g. IMWRITE_JPEG_QUALITY)
+            
+        Raises:
+            cv2.error: If OpenCV rejects the image or extension
+            IOError: If the encoder returned False
+        """
+        if not cv2.imwrite(path, image, params or []):
+            raise IOError(f"Failed to save image: {path} (encoder returned False)")
+    
+    @staticmethod
+    def save_image(image, path: str, params: Optional[List[int]] = None) -> bool:
         """
         Save image to file
         
         Args:
             image: Image to save
             path: Destination path
+            params: Optional OpenCV encoding flags (e.g. IMWRITE_JPEG_QUALITY)
             
         Returns:
             True if successful, False otherwise
         """
         try:
-            cv2.imwrite(path, image)
+            ImageProcessor.write_image(image, path, params)
             return True
         except Exception as e:
             logger.error(f"Error saving image: {str(e)}")
@@ -0,0 +1,114 @@
+import csv
+import json
+
+import pytest
+
+np = pytest.importorskip("numpy")
+cv2 = pytest.importorskip("cv2")
+
+from image_exporter import ExportOptions, ImageExporter
+
+DETECTIONS = [{
+    "class_id": 0, "class_name": "person", "confidence": 0.9,
+    "x1": 1.0, "y1": 2.0, "x2": 3.0, "y2": 4.0
+}]
+
+
+@pytest.fixture
+def exporter():
+    exporter = ImageExporter(max_workers=2)
+    yield exporter
+    exporter.shutdown()
+
+
+def _image():
+    return np.zeros((16, 16, 3), dtype=np.uint8)
+
+
+@pytest.mark.parametrize("path, expected", [
+    ("a.jpg", [cv2.IMWRITE_JPEG_QUALITY, 80, cv2.IMWRITE_JPEG_PROGRESSIVE, 1]),
+    ("a.JPEG", [cv2.IMWRITE_JPEG_QUALITY, 80, cv2.IMWRITE_JPEG_PROGRESSIVE, 1]),
+    ("a.png", [cv2.IMWRITE_PNG_COMPRESSION, 7]),
+    ("a.webp", [cv2.IMWRITE_WEBP_QUALITY, 60]),
+    ("a.bmp", []),
+])
+def test_encode_params(path, expected):
+    options = ExportOptions(
+        jpeg_quality=80, jpeg_progressive=True,
+        png_compression=7, webp_quality=60
+    )
+    assert options.encode_params(path) == expected
+
+
+@pytest.mark.parametrize("kwargs", [
+    {"jpeg_quality": 101},
+    {"png_compression": 10},
+    {"webp_quality": 0},
+    {"sidecar_format": "xml"},
+])
+def test_invalid_options_rejected(kwargs):
+    with pytest.raises(ValueError):
+        ExportOptions(**kwargs)
+
+
+def test_with_sidecar_validates():
+    with pytest.raises(ValueError):
+        ExportOptions().with_sidecar("xml")
+
+
+def test_json_sidecar(tmp_path, exporter):
+    path = tmp_path / "a.png"
+    result = exporter.submit(
+        _image(), str(path), DETECTIONS,
+        options=ExportOptions(sidecar_format="json")
+    ).result()
+
+    assert result["success"]
+    with open(tmp_path / "a.json", encoding="utf-8") as f:
+        assert json.load(f) == {"image": "a.png", "detections": DETECTIONS}
+
+
+def test_csv_sidecar(tmp_path, exporter):
+    path = tmp_path / "a.jpg"
+    result = exporter.submit(
+        _image(), str(path), DETECTIONS,
+        options=ExportOptions(sidecar_format="csv")
+    ).result()
+
+    assert result["success"]
+    with open(tmp_path / "a.csv", encoding="utf-8", newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert rows == [{k: str(v) for k, v in DETECTIONS[0].items()}]
+
+
+def test_sidecar_failure_keeps_image(tmp_path, exporter):
+    (tmp_path / "a.json").mkdir()
+    result = exporter.submit(
+        _image(), str(tmp_path / "a.png"), DETECTIONS,
+        options=ExportOptions(sidecar_format="json")
+    ).result()
+
+    assert result["image_written"] and result["bytes"] > 0
+    assert not result["success"]
+    assert result["error"] is None and result["sidecar_error"]
+
+
+def test_unsupported_extension_reports_opencv_error(tmp_path, exporter):
+    result = exporter.submit(_image(), str(tmp_path / "a.xyz")).result()
+
+    assert not result["success"] and not result["image_written"]
+    assert "could not find a writer" in result["error"]
+
+
+def test_export_batch_throughput(tmp_path, exporter):
+    batch = exporter.export_batch([
+        {"image": _image(), "path": str(tmp_path / f"{i}.png")}
+        for i in range(4)
+    ])
+
+    assert batch["images"] == 4
+    assert all(r["success"] for r in batch["results"])
+    assert batch["bytes"] == sum(r["bytes"] for r in batch["results"])
+    assert batch["seconds"] > 0
+    assert exporter.get_statistics()["images"] == 4
+    assert exporter.pending_count() == 0
@@ -0,0 +1,27 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+cv2 = pytest.importorskip("cv2")
+
+from image_processor import ImageProcessor
+
+
+def _image():
+    return np.zeros((8, 8, 3), dtype=np.uint8)
+
+
+def test_save_image_returns_false_when_imwrite_fails(tmp_path, monkeypatch):
+    monkeypatch.setattr(cv2, "imwrite", lambda *args: False)
+    assert ImageProcessor.save_image(_image(), str(tmp_path / "a.png")) is False
+
+
+def test_write_image_reports_encoder_false(tmp_path, monkeypatch):
+    monkeypatch.setattr(cv2, "imwrite", lambda *args: False)
+    with pytest.raises(IOError, match="encoder returned False"):
+        ImageProcessor.write_image(_image(), str(tmp_path / "a.png"))
+
+
+def test_save_image_writes_file(tmp_path):
+    path = tmp_path / "a.png"
+    assert ImageProcessor.save_image(_image(), str(path)) is True
+    assert path.stat().st_size > 0